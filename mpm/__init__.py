@@ -1,19 +1,17 @@
-from collections import OrderedDict
-
-
 def pformat_dict(data, separator='  '):
-    column_widths = OrderedDict([(k, max([len(k)] +
-                                         [len(str(v)) for v in values]))
-                                 for k, values in data.items()])
+    # Convert each cell to a string exactly once (column values may be
+    # single-pass iterators, e.g., `map` objects).
+    str_columns = [[str(v) for v in values] for values in data.values()]
+    column_widths = [max(len(k), max(map(len, values), default=0))
+                     for k, values in zip(data.keys(), str_columns)]
+
+    def format_row(row):
+        return separator.join([value.rjust(column_width) for value, column_width
+                               in zip(row, column_widths)])
 
-    header = separator.join([('{:>%ds}' % (column_width)).format(value)
-                             for value, column_width in
-                             zip(list(data.keys()), list(column_widths.values()))])
+    header = format_row(data.keys())
     hbar = separator.join(['-' * column_width
-                           for column_width in column_widths.values()])
-    rows = [separator.join([('{:>%ds}' % (column_width)).format(value)
-                            for value, column_width in
-                            zip(row, list(column_widths.values()))])
-            for row in zip(*list(data.values()))]
+                           for column_width in column_widths])
+    rows = [format_row(row) for row in zip(*str_columns)]
 
     return '\n'.join([header, hbar] + rows)
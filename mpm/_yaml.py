@@ -0,0 +1,62 @@
+# coding: utf-8
+'''
+Shared YAML helpers.
+'''
+import functools
+import os
+
+import yaml
+
+#: Safe YAML loader (uses C-accelerated ``libyaml`` loader, if available).
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def safe_load(stream):
+    '''
+    Parse YAML document using :data:`SafeLoader`.
+
+    Parameters
+    ----------
+    stream : str, bytes or file-like
+        YAML document.  Pass ``bytes`` (e.g., ``path.bytes()``) to let
+        ``libyaml`` decode UTF-8 directly.
+
+    Returns
+    -------
+    object
+        Parsed document.
+    '''
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_properties(properties_path, inode, mtime_ns, ctime_ns, size):
+    with open(properties_path, 'rb') as input_:
+        return safe_load(input_.read())
+
+
+def load_properties(properties_path):
+    '''
+    Load plugin ``properties.yml`` file.
+
+    Parsed properties are cached by path, inode, modification time, status
+    change time, and size, so repeated loads of an unchanged file only cost a
+    ``stat``.  The status change time is included because extracted archive
+    members keep the modification time stored in the archive.
+
+    Parameters
+    ----------
+    properties_path : str
+        Path to ``properties.yml`` file.
+
+    Returns
+    -------
+    dict
+        Plugin properties (a copy; safe to modify).
+    '''
+    properties_path = os.fspath(properties_path)
+    stat = os.stat(properties_path)
+    properties = _load_properties(properties_path, stat.st_ino,
+                                  stat.st_mtime_ns, stat.st_ctime_ns,
+                                  stat.st_size)
+    return dict(properties) if isinstance(properties, dict) else properties
@@ -3,15 +3,37 @@
 See https://github.com/wheeler-microfluidics/microdrop/issues/216
 '''
 import bz2
+import concurrent.futures
+import functools
+import gzip
 import importlib
+import importlib.util
 import logging
 import json
+import os
+import pickle
 import platform
 import re
 import sys
+import time
+import typing
 import conda_helpers as ch
 from microdrop_libs.path_helpers import path
-import yaml
+
+from ._yaml import safe_load
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +42,207 @@ MICRODROP_CONDA_SHARE = ch.conda_prefix().joinpath('share', 'microdrop')
 MICRODROP_CONDA_ACTIONS = MICRODROP_CONDA_ETC.joinpath('actions')
 MICRODROP_CONDA_PLUGINS = MICRODROP_CONDA_ETC.joinpath('plugins')
 
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Plugin directories, as plain strings for fast `os.path` joins.
+#
+# Conda-managed plugins
+_AVAILABLE_SHARE = str(MICRODROP_CONDA_SHARE.joinpath('plugins', 'available'))
+# User-managed plugins
+_AVAILABLE_ETC = str(MICRODROP_CONDA_ETC.joinpath('plugins', 'available'))
+# Links to enabled plugins
+_ENABLED = str(MICRODROP_CONDA_PLUGINS.joinpath('enabled'))
+
+# Package metadata directory of the active Conda environment.
+_CONDA_META = ch.conda_prefix().joinpath('conda-meta')
+# Revision history file maintained by Conda for the active environment.
+_CONDA_HISTORY = _CONDA_META.joinpath('history')
+# Each revision in the history file begins with a `==> <date> <==` header.
+_CRE_HISTORY_REV = re.compile(rb'==>\s*([^<]+?)\s*<==')
+# Revisions parsed from history file, keyed by history file `(mtime, size)`.
+_revisions_cache = {}
+# Installed plugins and available plugins directory modified times, keyed by
+# `only_conda` argument of `installed_plugins()`.
+_installed_plugins_cache = {}
+
+# Results of `conda search` for MicroDrop plugins, cached while Conda's
+# repodata cache is unchanged.
+_AVAILABLE_CACHE_PATH = MICRODROP_CONDA_ETC.joinpath('_available_cache.pkl')
+# Conda repodata cache is considered stale after this many seconds (see
+# `local_repodata_ttl` Conda setting).
+_REPODATA_TTL = 60 * 60
+
+if msgspec is not None:
+    class _Revision(msgspec.Struct):
+        rev: int
+
+    class _Action(msgspec.Struct):
+        # Only the revision numbers are needed to roll back an action.
+        revisions: typing.List[_Revision]
+
+    _ACTION_DECODER = msgspec.json.Decoder(_Action)
+
 __all__ = ['available_packages', 'install', 'rollback', 'uninstall',
            'enable_plugin', 'disable_plugin', 'update', 'MICRODROP_CONDA_ETC',
            'MICRODROP_CONDA_SHARE', 'MICRODROP_CONDA_ACTIONS',
            'MICRODROP_CONDA_PLUGINS']
 
 
+@functools.lru_cache(maxsize=1)
+def _repodata_cache_dir():
+    """
+    Returns
+    -------
+    path
+        Conda repodata cache directory, i.e., ``<conda root>/pkgs/cache``.
+    """
+    return ch.conda_root().joinpath('pkgs', 'cache')
+
+
+def _repodata_fingerprint():
+    """
+    Returns
+    -------
+    tuple or None
+        ``(name, mtime, size)`` for each file in Conda repodata cache
+        directory, or ``None`` if the cache is missing or any file in it is
+        stale.
+    """
+    fingerprint = []
+    try:
+        with os.scandir(_repodata_cache_dir()) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    stat = entry.stat()
+                    fingerprint.append((entry.name, stat.st_mtime_ns,
+                                        stat.st_size))
+    except (OSError, RuntimeError):
+        return None
+    if not fingerprint:
+        return None
+    oldest_mtime = min(mtime_i for name_i, mtime_i, size_i in fingerprint)
+    if time.time() - oldest_mtime * 1e-9 > _REPODATA_TTL:
+        # Conda has not refreshed repodata of some channel recently.
+        return None
+    return tuple(sorted(fingerprint))
+
+
+def _file_key(file_path):
+    """
+    Returns
+    -------
+    tuple or None
+        ``(mtime, size)`` of file, or ``None`` if file does not exist.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _channels():
+    """
+    Returns
+    -------
+    tuple or None
+        Channels configured for Conda (e.g., in ``.condarc``), in priority
+        order, or ``None`` if the channel list could not be resolved.
+
+        Channels are only resolved again if a Conda configuration file is
+        modified.
+    """
+    condarc_paths = [ch.conda_root().joinpath('.condarc'),
+                     ch.conda_prefix().joinpath('.condarc'),
+                     os.path.expanduser(os.path.join('~', '.condarc')),
+                     os.path.expanduser(os.path.join('~', '.conda',
+                                                     'condarc')),
+                     os.path.expanduser(os.path.join('~', '.config', 'conda',
+                                                     'condarc'))]
+    if 'CONDARC' in os.environ:
+        condarc_paths.append(os.environ['CONDARC'])
+    try:
+        return _resolve_channels(tuple((str(path_i), _file_key(path_i))
+                                       for path_i in condarc_paths))
+    except Exception:
+        logger.debug('Error resolving Conda channels.', exc_info=True)
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_channels(condarc_key):
+    """
+    Parameters
+    ----------
+    condarc_key : tuple
+        Path and ``(mtime, size)`` of each Conda configuration file, used to
+        invalidate cached result.
+
+    Returns
+    -------
+    tuple
+        Channels configured for Conda, in priority order.
+    """
+    config_json = _conda_exec('config', '--show', 'channels', '--json')
+    return tuple(_json_loads(config_json)['channels'])
+
+
+def _json_loads(data):
+    """
+    Decode JSON document, using ``orjson`` if available.
+
+    Parameters
+    ----------
+    data : bytes or str
+        JSON document.
+
+    Returns
+    -------
+    object
+        Decoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """
+    Encode object as indented JSON document, using ``orjson`` if available.
+
+    Parameters
+    ----------
+    obj : object
+        JSON-serializable object.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf8')
+
+
+def _action_rollback_revision(data):
+    """
+    Parameters
+    ----------
+    data : bytes
+        JSON-encoded action (see :func:`_save_action`).
+
+    Returns
+    -------
+    int
+        Revision of Conda environment before action was performed.
+    """
+    if msgspec is not None:
+        # Only decode revision numbers from action.
+        return _ACTION_DECODER.decode(data).revisions[-2].rev
+    return _json_loads(data)['revisions'][-2]['rev']
+
+
 def _islinklike(dir_path):
     """
     Parameters
@@ -39,7 +256,7 @@ def _islinklike(dir_path):
         ``True`` if :data:`dir_path` is a link *or* junction.
     """
     dir_path = path(dir_path)
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         if dir_path.isjunction():
             return True
     elif dir_path.islink():
@@ -47,6 +264,300 @@ def _islinklike(dir_path):
     return False
 
 
+@functools.lru_cache(maxsize=1)
+def _conda_run_command():
+    '''
+    Returns
+    -------
+    function or None
+        :func:`conda.cli.python_api.run_command` if Conda is importable in the
+        current Python interpreter, otherwise ``None``.
+    '''
+    try:
+        from conda.cli.python_api import run_command
+    except ImportError:
+        return None
+    return run_command
+
+
+def _conda_exec(*args, **kwargs):
+    '''
+    Execute Conda command.
+
+    If possible, the command is run **in-process** using the Conda Python
+    API to avoid the cost of launching a new Conda process.  Otherwise, fall
+    back to :func:`conda_helpers.conda_exec`.
+
+    Parameters
+    ----------
+    *args
+        Conda command and arguments, e.g., ``'list', '--json'``.
+    **kwargs
+        Extra keyword arguments to pass to :func:`conda_helpers.conda_exec`
+        (ignored when running in-process).
+
+    Returns
+    -------
+    str
+        Output of Conda command.
+
+    Raises
+    ------
+    RuntimeError
+        If Conda command fails.
+    '''
+    run_command = _conda_run_command()
+    if run_command is None:
+        return ch.conda_exec(*args, verbose=False, **kwargs)
+
+    stdout, stderr, returncode = run_command(args[0], *args[1:],
+                                             use_exception_handler=True)
+    if returncode != 0:
+        # Include output since Conda reports errors (e.g., `CondaHTTPError`)
+        # as JSON to `stdout` when `--json` is specified.
+        raise RuntimeError('Error executing `conda {}`:\n{}\n{}'
+                           .format(' '.join(args), stdout, stderr))
+    return stdout
+
+
+def _clear_caches():
+    '''
+    Clear cached Conda environment state.
+
+    Must be called after each Conda command that may modify the Conda
+    environment (e.g., ``install``, ``uninstall``).
+    '''
+    _revisions_cache.clear()
+    _installed_plugins_cache.clear()
+    try:
+        # Installed flags of cached available packages may be stale.
+        os.remove(_AVAILABLE_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    _conda_meta_packages.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _conda_meta_packages(mtime_ns):
+    '''
+    Parameters
+    ----------
+    mtime_ns : int
+        Modified time of ``<conda prefix>/conda-meta`` directory (used as cache
+        key).
+
+    Returns
+    -------
+    dict
+        Mapping from name of each package installed in the active Conda
+        environment to a dictionary containing the ``name``, ``version``, and
+        ``build`` of the package.
+    '''
+    packages = {}
+    with os.scandir(_CONDA_META) as entries:
+        for entry in entries:
+            # Each installed package has a corresponding
+            # `<name>-<version>-<build>.json` record file.
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                name, version, build = entry.name[:-5].rsplit('-', 2)
+            except ValueError:
+                continue
+            packages[name] = {'name': name, 'version': version,
+                              'build': build}
+    return packages
+
+
+def _conda_packages():
+    '''
+    Returns
+    -------
+    dict or None
+        Mapping from name of each package installed in the active Conda
+        environment to package info (see :func:`_conda_meta_packages`), or
+        ``None`` if ``<conda prefix>/conda-meta`` could not be read.
+    '''
+    try:
+        return _conda_meta_packages(os.stat(_CONDA_META).st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _installed_package_infos(package_names):
+    '''
+    Look up installed Conda package info for each specified package.
+
+    Package records are read directly from ``<conda prefix>/conda-meta``
+    (rather than launching a Conda subprocess) and cached until the
+    ``conda-meta`` directory is modified.
+
+    Parameters
+    ----------
+    package_names : list
+        Conda package names.
+
+    Returns
+    -------
+    list
+        Package info dictionary (containing *at least* the ``name`` and
+        ``version`` keys) for each specified package that is installed in the
+        active Conda environment.  A warning is logged for each package that
+        is not installed.
+    '''
+    packages = _conda_packages()
+    if packages is None:
+        # Fall back to querying Conda.
+        try:
+            return ch.package_version(package_names, verbose=False)
+        except ch.PackageNotFound as exception:
+            logger.warning(str(exception))
+            return exception.available
+
+    missing = [name_i for name_i in package_names if name_i not in packages]
+    if missing:
+        logger.warning('The following package(s) could not be found: %s',
+                       ', '.join('`{}`'.format(name_i) for name_i in missing))
+    return [packages[name_i] for name_i in package_names
+            if name_i in packages]
+
+
+def _get_revisions():
+    """
+    Get list of revisions for active Conda environment.
+
+    Revisions are parsed directly from ``<conda prefix>/conda-meta/history``
+    (rather than launching ``conda list --revisions``) and cached until the
+    history file is modified.
+
+    Returns
+    -------
+    list
+        List of revisions, oldest first.  Each revision is a dictionary
+        containing *at least* the ``rev`` and ``date`` keys, similar to the
+        output of ``conda list --revisions --json``.
+    """
+    try:
+        stat = os.stat(_CONDA_HISTORY)
+    except OSError:
+        stat = None
+    else:
+        key = (stat.st_mtime_ns, stat.st_size)
+        if _revisions_cache.get('key') == key:
+            return _revisions_cache['revisions']
+
+    revisions = []
+    if stat is not None:
+        try:
+            # Split into `[<preamble>, <date 0>, <body 0>, <date 1>, ...]`.
+            fields = _CRE_HISTORY_REV.split(_CONDA_HISTORY.read_bytes())
+            for rev, (date, body) in enumerate(zip(fields[1::2],
+                                                   fields[2::2])):
+                lines = [line_i.strip() for line_i in body.splitlines()]
+                revisions.append({'rev': rev, 'date': date.decode('utf8'),
+                                  'install': [line_i[1:].decode('utf8')
+                                              for line_i in lines
+                                              if line_i.startswith(b'+')],
+                                  'remove': [line_i[1:].decode('utf8')
+                                             for line_i in lines
+                                             if line_i.startswith(b'-')]})
+        except Exception:
+            logger.debug('Error parsing Conda history: `%s`', _CONDA_HISTORY,
+                         exc_info=True)
+            revisions = []
+
+    if not revisions:
+        # Fall back to querying Conda.
+        revisions_js = _conda_exec('list', '--revisions', '--json')
+        return _json_loads(revisions_js)
+
+    _revisions_cache['key'] = key
+    _revisions_cache['revisions'] = revisions
+    return revisions
+
+
+def _entry_islinklike(entry):
+    """
+    Parameters
+    ----------
+    entry : os.DirEntry
+        Directory entry.
+
+    Returns
+    -------
+    bool
+        ``True`` if :data:`entry` is a link *or* junction.
+    """
+    if entry.is_symlink():
+        return True
+    return _IS_WINDOWS and path(entry.path).isjunction()
+
+
+def _read_properties(plugin_dir):
+    """
+    Read plugin package info from ``properties.yml`` file.
+
+    Parameters
+    ----------
+    plugin_dir : str
+        Plugin directory path.
+
+    Returns
+    -------
+    dict or None
+        Plugin properties, including ``path`` to plugin directory, or ``None``
+        if properties could not be read.
+    """
+    properties_path = os.path.join(plugin_dir, 'properties.yml')
+    try:
+        with open(properties_path, 'rb') as input_:
+            properties = safe_load(input_.read())
+        properties['path'] = path(plugin_dir).realpath()
+    except Exception:
+        logger.info('[warning] Could not read package info: `%s`',
+                    properties_path, exc_info=True)
+        return None
+    return properties
+
+
+def _read_properties_many(plugin_dirs):
+    """
+    Read plugin package info from ``properties.yml`` file of each plugin
+    directory concurrently.
+
+    Parameters
+    ----------
+    plugin_dirs : list
+        Plugin directory paths.
+
+    Returns
+    -------
+    list
+        Plugin properties (see :func:`_read_properties`), in the same order as
+        :data:`plugin_dirs`, skipping plugins with unreadable properties.
+    """
+    if len(plugin_dirs) < 2:
+        properties = [_read_properties(dir_i) for dir_i in plugin_dirs]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(16, len(plugin_dirs))) as executor:
+            properties = list(executor.map(_read_properties, plugin_dirs))
+    return [properties_i for properties_i in properties
+            if properties_i is not None]
+
+
+def _current_revision():
+    """
+    Returns
+    -------
+    int
+        Current revision of active Conda environment (``0`` if no revisions
+        are recorded).
+    """
+    revisions = _get_revisions()
+    return revisions[-1]['rev'] if revisions else 0
+
+
 def _save_action(extra_context=None):
     """
     Save list of revisions revisions for active Conda environment.
@@ -54,6 +565,9 @@ def _save_action(extra_context=None):
     .. versionchanged:: 0.18
         Compress action revision files using ``bz2`` to save disk space.
 
+    Action revision files are compressed using ``zstandard`` (if available)
+    or ``gzip``, both of which are much faster than ``bz2``.
+
     Parameters
     ----------
     extra_context : dict, optional
@@ -66,25 +580,59 @@ def _save_action(extra_context=None):
         revisions for active Conda environment.
     """
     # Get list of revisions to Conda environment since creation.
-    revisions_js = ch.conda_exec('list', '--revisions', '--json',
-                                 verbose=False)
-    revisions = json.loads(revisions_js)
+    revisions = _get_revisions()
     # Save list of revisions to `/etc/microdrop/plugins/actions/rev<rev>.json`
     # See [wheeler-microfluidics/microdrop#200][i200].
     #
     # [i200]: https://github.com/wheeler-microfluidics/microdrop/issues/200
     action = extra_context.copy() if extra_context else {}
     action['revisions'] = revisions
-    action_path = (MICRODROP_CONDA_ACTIONS
-                   .joinpath('rev{}.json.bz2'.format(revisions[-1]['rev'])))
-    action_path.parent.makedirs_p()
-    # Compress action file using bz2 to save disk space.
-    with bz2.open(action_path, mode='wt', compresslevel=9) as output:
-        json.dump(action, output, indent=2)
+    action_name = 'rev{}.json'.format(revisions[-1]['rev'])
+    MICRODROP_CONDA_ACTIONS.makedirs_p()
+    # Compress action file to save disk space.
+    data = _json_dumps(action)
+    if zstandard is not None:
+        action_path = MICRODROP_CONDA_ACTIONS.joinpath(action_name + '.zst')
+        action_path.write_bytes(zstandard.ZstdCompressor(level=3)
+                                .compress(data))
+    else:
+        action_path = MICRODROP_CONDA_ACTIONS.joinpath(action_name + '.gz')
+        action_path.write_bytes(gzip.compress(data, compresslevel=1))
 
     return action_path, action
 
 
+def _latest_action_file():
+    '''
+    Returns
+    -------
+    int, path or None
+        Revision and path of most recent action file in
+        :attr:`MICRODROP_CONDA_ACTIONS`, or ``None`` if no actions have been
+        recorded.
+    '''
+    latest = None
+    try:
+        entries = os.scandir(MICRODROP_CONDA_ACTIONS)
+    except OSError:
+        return None
+    with entries:
+        for entry in entries:
+            # Action file names are of the form `rev<revision>.json[.<ext>]`.
+            name, _, ext = entry.name.partition('.')
+            if not (name.startswith('rev') and ext and entry.is_file()):
+                continue
+            try:
+                rev = int(name[3:])
+            except ValueError:
+                continue
+            if latest is None or rev > latest[0]:
+                latest = rev, entry.path
+    if latest is None:
+        return None
+    return latest[0], path(latest[1])
+
+
 def _remove_broken_links():
     '''
     Remove broken links in `<conda prefix>/etc/microdrop/plugins/enabled/`.
@@ -94,28 +642,30 @@ def _remove_broken_links():
     list
         List of links removed (if any).
     '''
-    enabled_dir = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
-    if not enabled_dir.isdir():
+    try:
+        entries = os.scandir(_ENABLED)
+    except OSError:
         return []
 
     broken_links = []
-    for dir_i in enabled_dir.walkdirs(errors='ignore'):
-        if platform.system() == 'Windows':
-            if dir_i.isjunction() and not dir_i.readlink().isdir():
-                # Junction/link target no longer exists.
-                broken_links.append(dir_i)
-        else:
-            # currently do not support non windows
-            raise NotImplementedError('Unsupported platform')
+    with entries:
+        # Enabled directory is flat, i.e., each entry is a link/junction to a
+        # plugin directory.
+        for entry in entries:
+            try:
+                os.stat(entry.path)
+            except FileNotFoundError:
+                # Entry exists but link/junction target no longer exists.
+                broken_links.append(entry.path)
 
     removed_links = []
     for link_i in broken_links:
         try:
-            link_i.unlink()
-        except:
+            os.unlink(link_i)
+        except OSError:
             pass
         else:
-            removed_links.append(link_i)
+            removed_links.append(path(link_i))
     return removed_links
 
 
@@ -144,6 +694,10 @@ def available_packages(*args, **kwargs):
             All Conda packages beginning with ``microdrop.`` prefix from all
             configured channels.
 
+        Results are cached in :data:`_AVAILABLE_CACHE_PATH` and reused until
+        Conda's repodata cache is modified or becomes stale, the configured
+        channels change, or the Conda environment is modified.
+
         Each *key* corresponds to a package name.
 
         Each *value* corresponds to a ``list`` of dictionaries, each
@@ -169,12 +723,27 @@ def available_packages(*args, **kwargs):
                 ...
             }
     """
+    # Conda history is modified whenever packages are (un)installed, i.e.,
+    # whenever `installed` flags of cached packages may be stale.
+    cache_args = (args, sorted(kwargs.items()), _file_key(_CONDA_HISTORY),
+                  _channels())
+    fingerprint = _repodata_fingerprint()
+    if fingerprint is not None and cache_args[-1] is not None:
+        try:
+            with _AVAILABLE_CACHE_PATH.open('rb') as input_:
+                cached_key, cached_packages = pickle.load(input_)
+        except Exception:
+            pass
+        else:
+            if cached_key == (cache_args, fingerprint):
+                return cached_packages
+
     # Get list of available MicroDrop plugins, i.e., Conda packages that start
     # with the prefix `microdrop.`.
     try:
-        plugin_packages_info_json = ch.conda_exec('search', '--json',
-                                                  '^microdrop\.', *args, **kwargs, verbose=False)
-        return json.loads(plugin_packages_info_json)
+        plugin_packages_info_json = _conda_exec('search', '--json',
+                                                '^microdrop\.', *args, **kwargs)
+        plugin_packages = _json_loads(plugin_packages_info_json)
     except RuntimeError as exception:
         if 'CondaHTTPError' in str(exception):
             logger.warning('Could not connect to Conda server.')
@@ -184,6 +753,19 @@ def available_packages(*args, **kwargs):
     except Exception as exception:
         logger.warning('Error querying available MicroDrop plugins.',
                        exc_info=True)
+    else:
+        # Search may have refreshed Conda repodata cache.
+        fingerprint = _repodata_fingerprint()
+        if fingerprint is not None and cache_args[-1] is not None:
+            try:
+                MICRODROP_CONDA_ETC.makedirs_p()
+                with _AVAILABLE_CACHE_PATH.open('wb') as output:
+                    pickle.dump(((cache_args, fingerprint), plugin_packages),
+                                output, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                logger.debug('Error caching available MicroDrop plugins.',
+                             exc_info=True)
+        return plugin_packages
     return {}
 
 
@@ -220,14 +802,24 @@ def install(plugin_name, *args, **kwargs):
 
     # Perform installation
     conda_args = (['install', '-y', '--json'] + list(args) + plugin_name)
-    install_log_js = ch.conda_exec(*conda_args, verbose=False)
-    install_log = json.loads(install_log_js.split('\x00')[-1])
+    install_log_js = _conda_exec(*conda_args)
+    # Conda environment may have been modified.
+    _clear_caches()
+    install_log = _json_loads(install_log_js.split('\x00')[-1])
 
     # Check for actual installation actions and if not a dry-run
     if 'actions' in install_log and not install_log.get('dry_run'):
 
         # Install command modified Conda environment. Save the action for potential rollback.
-        _save_action({'conda_args': conda_args, 'install_log': install_log})
+        # Note that the install log is **not** needed for rollback.
+        action_path, action = _save_action({'conda_args': conda_args})
+        if logger.isEnabledFor(logging.DEBUG):
+            # Save install log alongside action for debugging.
+            log_path = (MICRODROP_CONDA_ACTIONS
+                        .joinpath('install_logs', 'rev{}.install_log.json'
+                                  .format(action['revisions'][-1]['rev'])))
+            log_path.parent.makedirs_p()
+            log_path.write_bytes(_json_dumps(install_log))
         logger.debug('Installed plugin(s): %s', install_log['actions'])
 
     return install_log
@@ -244,6 +836,9 @@ def rollback(*args, **kwargs):
     .. versionchanged:: 0.18
         Add support for action revision files compressed using ``bz2``.
 
+    Action revision files compressed using ``zstandard`` (``.zst``) or
+    ``gzip`` (``.gz``) are also supported.
+
     .. versionchanged:: 0.24
         Remove channels argument.  Use Conda channels as configured in Conda
         environment.
@@ -266,35 +861,34 @@ def rollback(*args, **kwargs):
 
     `wheeler-microfluidics/microdrop#200 <https://github.com/wheeler-microfluidics/microdrop/issues/200>`
     """
-    action_files = list(MICRODROP_CONDA_ACTIONS.glob('*'))
-    if not action_files:
+    action_file = _latest_action_file()
+    if action_file is None:
         # No action files, return current revision.
         logger.debug('No rollback actions have been recorded.')
-        revisions_js = ch.conda_exec('list', '--revisions', '--json',
-                                     verbose=False)
-        revisions = json.loads(revisions_js)
-        return revisions[-1]['rev']
-
-    # Compiling regular expression to match revision files
-    cre_rev = re.compile(r'rev(?P<rev>\d+)')
-    action_file = sorted([(int(cre_rev.match(file_i.namebase).group('rev')),
-                           file_i) for file_i in
-                          action_files if cre_rev.match(file_i.namebase)],
-                         reverse=True)[0]
+        return _current_revision()
+
     # Do rollback (i.e., install state of previous revision).
-    if action_file[1].ext.lower() == '.bz2':
+    ext = action_file[1].ext.lower()
+    data = action_file[1].read_bytes()
+    if ext == '.zst':
+        # Assume file is compressed using zstandard.
+        if zstandard is None:
+            raise IOError('`zstandard` package is required to read `{}`'
+                          .format(action_file[1]))
+        data = zstandard.ZstdDecompressor().decompress(data)
+    elif ext == '.gz':
+        # Assume file is compressed using gzip.
+        data = gzip.decompress(data)
+    elif ext == '.bz2':
         # Assume file is compressed using bz2.
-        with bz2.BZ2File(action_file, mode='r') as input_:
-            action = json.load(input_)
-    else:
-        # Assume it is raw JSON.
-        with action_file.open('r') as input_:
-            action = json.load(input_)
-    rollback_revision = action['revisions'][-2]
+        data = bz2.decompress(data)
+    # Otherwise, assume it is raw JSON.
+    rollback_revision = _action_rollback_revision(data)
     conda_args = (['install', '--json'] + list(args) +
                   ['--revision', str(rollback_revision)])
-    install_log_js = ch.conda_exec(*conda_args, verbose=False)
-    install_log = json.loads(install_log_js.split('\x00')[-1])
+    install_log_js = _conda_exec(*conda_args)
+    _clear_caches()
+    install_log = _json_loads(install_log_js.split('\x00')[-1])
     logger.debug('Rolled back to revision %s', rollback_revision)
     return rollback_revision, install_log
 
@@ -325,24 +919,24 @@ def uninstall(plugin_name, *args):
     if isinstance(plugin_name, str):
         plugin_name = [plugin_name]
 
-    available_path = MICRODROP_CONDA_SHARE.joinpath('plugins', 'available')
     for name_i in plugin_name:
         plugin_module_i = name_i.split('.')[-1].replace('-', '_')
-        plugin_path_i = available_path.joinpath(plugin_module_i)
-        if not _islinklike(plugin_path_i) and not plugin_path_i.isdir():
+        plugin_path_i = os.path.join(_AVAILABLE_SHARE, plugin_module_i)
+        if not _islinklike(plugin_path_i) and not os.path.isdir(plugin_path_i):
             raise IOError('Plugin `{}` not found in `{}`'
-                          .format(name_i, available_path))
+                          .format(name_i, _AVAILABLE_SHARE))
         else:
             logger.debug(f'[uninstall] Found plugin `{plugin_path_i}`')
 
     # Perform uninstall operation.
     conda_args = ['uninstall', '--json', '-y'] + list(args) + plugin_name
-    uninstall_log_js = ch.conda_exec(*conda_args, verbose=False)
+    uninstall_log_js = _conda_exec(*conda_args)
+    _clear_caches()
     # Remove broken links in `<conda prefix>/etc/microdrop/plugins/enabled/`,
     # since uninstall may have made one or more packages unavailable.
     _remove_broken_links()
     logger.debug(f'Uninstalled plugins: {plugin_name}')
-    return json.loads(uninstall_log_js.split('\x00')[-1])
+    return _json_loads(uninstall_log_js.split('\x00')[-1])
 
 
 #      * [x] Enable/disable installed plugin package(s)
@@ -379,50 +973,50 @@ def enable_plugin(plugin_name):
     else:
         singleton = False
 
-    # Conda-managed plugins
-    shared_available_path = MICRODROP_CONDA_SHARE.joinpath('plugins',
-                                                           'available')
-    # User-managed plugins
-    etc_available_path = MICRODROP_CONDA_ETC.joinpath('plugins', 'available')
-
-    available_paths = (etc_available_path, shared_available_path)
+    # User-managed plugins take precedence over Conda-managed plugins.
+    available_paths = (_AVAILABLE_ETC, _AVAILABLE_SHARE)
     plugin_paths = []
     for name_i in plugin_name:
         for available_path_j in available_paths:
-            plugin_path_ij = available_path_j.joinpath(name_i)
-            if not _islinklike(plugin_path_ij) and plugin_path_ij.isdir():
+            plugin_path_ij = os.path.join(available_path_j, name_i)
+            if (os.path.isdir(plugin_path_ij) and
+                    not _islinklike(plugin_path_ij)):
                 logger.debug('Found plugin directory: `%s`', plugin_path_ij)
                 break
         else:
             raise IOError('Plugin `{}` not found in `{}` or `{}`'
                           .format(name_i, *available_paths))
-        plugin_paths.append(plugin_path_ij)
+        plugin_paths.append(path(plugin_path_ij))
 
     # All specified plugins are available.
 
     # Link all specified plugins in
     # `<conda prefix>/etc/microdrop/plugins/enabled/` (if not already linked).
-    enabled_path = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
-    enabled_path.makedirs_p()
+    os.makedirs(_ENABLED, exist_ok=True)
 
     # Set flag for each plugin: `False` iff the plugin was already enabled,
     # `True` iff it was just enabled now.
     enabled_now = {}
     for plugin_path_i in plugin_paths:
-        plugin_link_path_i = enabled_path.joinpath(plugin_path_i.name)
-        if not plugin_link_path_i.exists():
-            if platform.system() == 'Windows':
+        plugin_link_path_i = os.path.join(_ENABLED, plugin_path_i.name)
+        try:
+            if _IS_WINDOWS:
+                # `path.junction()` (i.e., `ntfsutils`) raises a generic
+                # `Exception` if the link already exists.
+                if os.path.lexists(plugin_link_path_i):
+                    raise FileExistsError(plugin_link_path_i)
                 plugin_path_i.junction(plugin_link_path_i)
             else:
-                plugin_path_i.symlink(plugin_link_path_i)
-            logger.debug('Enabled plugin directory: `%s` -> `%s`',
-                         plugin_path_i, plugin_link_path_i)
-            enabled_now[plugin_path_i.name] = True
-        else:
+                os.symlink(plugin_path_i, plugin_link_path_i)
+        except FileExistsError:
             logger.debug('Plugin already enabled: `%s` -> `%s`', plugin_path_i,
                          plugin_link_path_i)
             enabled_now[plugin_path_i.name] = False
-    return enabled_now if not singleton else enabled_now.values()[0]
+        else:
+            logger.debug('Enabled plugin directory: `%s` -> `%s`',
+                         plugin_path_i, plugin_link_path_i)
+            enabled_now[plugin_path_i.name] = True
+    return enabled_now if not singleton else next(iter(enabled_now.values()))
 
 
 def disable_plugin(plugin_name):
@@ -443,20 +1037,19 @@ def disable_plugin(plugin_name):
         plugin_name = [plugin_name]
 
     # Verify all specified plugins are currently enabled.
-    enabled_path = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
     for name_i in plugin_name:
-        plugin_path_i = enabled_path.joinpath(name_i)
-        if not _islinklike(plugin_path_i) and not plugin_path_i.isdir():
+        plugin_path_i = os.path.join(_ENABLED, name_i)
+        if not _islinklike(plugin_path_i) and not os.path.isdir(plugin_path_i):
             raise IOError('Plugin `{}` not found in `{}`'
-                          .format(name_i, enabled_path))
+                          .format(name_i, _ENABLED))
 
     # All specified plugins are enabled.
 
     # Remove all specified plugins from
     # `<conda prefix>/etc/microdrop/plugins/enabled/`.
     for name_i in plugin_name:
-        plugin_link_path_i = enabled_path.joinpath(name_i)
-        plugin_link_path_i.unlink()
+        plugin_link_path_i = os.path.join(_ENABLED, name_i)
+        os.unlink(plugin_link_path_i)
         logger.debug('Disabled plugin `%s` (i.e., removed `%s`)',
                      plugin_path_i, plugin_link_path_i)
 
@@ -544,6 +1137,10 @@ def import_plugin(package_name, include_available=False):
     """
     Import MicroDrop plugin.
 
+    Plugin module is loaded directly from the plugin directory, without
+    modifying the Python import paths.  A module already imported under the
+    same name is only reused if it was loaded from the plugin directory.
+
     Parameters
     ----------
     package_name : str
@@ -553,33 +1150,79 @@ def import_plugin(package_name, include_available=False):
         ones).
 
         By default, only the ``<conda>/etc/microdrop/plugins/enabled``
-        directory is added to the Python import paths (if necessary).
+        directory is searched for the plugin.
 
-        If ``True``, also add the ``<conda>/share/microdrop/plugins/available``
-        directory to the Python import paths.
+        If ``True``, also search the
+        ``<conda>/share/microdrop/plugins/available`` directory.
 
     Returns
     -------
     module
         Imported plugin module.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If plugin module is not found in any of the searched directories.
     """
-    available_plugins_dir = MICRODROP_CONDA_SHARE.joinpath('plugins',
-                                                           'available')
-    enabled_plugins_dir = MICRODROP_CONDA_ETC.joinpath('plugins', 'enabled')
-    search_paths = [enabled_plugins_dir]
+    module_name = package_name.split('.')[-1].replace('-', '_')
+    search_paths = [_ENABLED]
     if include_available:
-        search_paths += [available_plugins_dir]
+        search_paths += [_AVAILABLE_SHARE]
     for dir_i in search_paths:
-        if dir_i not in sys.path:
-            sys.path.insert(0, dir_i)
-    module_name = package_name.split('.')[-1].replace('-', '_')
-    return importlib.import_module(module_name)
+        # Plugin may be either a package or a single module file.
+        for module_path_ij in (os.path.join(dir_i, module_name,
+                                            '__init__.py'),
+                               os.path.join(dir_i, module_name + '.py')):
+            if os.path.isfile(module_path_ij):
+                break
+        else:
+            continue
+        break
+    else:
+        raise ModuleNotFoundError('No plugin module named `{}` found in: {}'
+                                  .format(module_name, ', '
+                                          .join('`{}`'.format(dir_i)
+                                                for dir_i in search_paths)),
+                                  name=module_name)
+
+    existing_module = sys.modules.get(module_name)
+    module_file = getattr(existing_module, '__file__', None)
+    if module_file is not None:
+        # Reuse previously imported module only if it was loaded from the
+        # same plugin (not, e.g., an unrelated module with the same name).
+        plugin_path = os.path.realpath(module_path_ij
+                                       if module_path_ij.endswith(module_name
+                                                                  + '.py')
+                                       else os.path.dirname(module_path_ij))
+        module_file = os.path.realpath(module_file)
+        if module_file == plugin_path or \
+                module_file.startswith(plugin_path + os.sep):
+            return existing_module
+
+    spec = importlib.util.spec_from_file_location(module_name,
+                                                  module_path_ij)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        if existing_module is not None:
+            sys.modules[module_name] = existing_module
+        else:
+            del sys.modules[module_name]
+        raise
+    return module
 
 
 def installed_plugins(only_conda=False):
     """
     .. versionadded:: 0.20
 
+    Results are cached until a plugin directory is added to or removed from
+    ``share/microdrop/plugins/available``, or until the Conda environment is
+    modified through this module.
+
     Parameters
     ----------
     only_conda : bool, optional
@@ -603,45 +1246,53 @@ def installed_plugins(only_conda=False):
             If :data:`only_conda` is ``True``, only properties for plugins that
             are installed **as Conda packages** are returned.
     """
-    available_path = MICRODROP_CONDA_SHARE.joinpath('plugins', 'available')
-    if not available_path.isdir():
+    try:
+        with os.scandir(_AVAILABLE_SHARE) as entries:
+            entries = list(entries)
+        # Plugins are (un)installed by adding/removing plugin directories, so
+        # modified times of available directory and plugin directories are
+        # used to determine if cached plugin list is still valid.
+        cache_key = (os.stat(_AVAILABLE_SHARE).st_mtime_ns,
+                     max([entry.stat(follow_symlinks=False).st_mtime_ns
+                          for entry in entries], default=0))
+    except OSError:
         return []
-
-    installed_plugins_ = []
-    for plugin_path_i in available_path.dirs():
-        # Only process plugin directory if it is *not a link*.
-        if not _islinklike(plugin_path_i):
-            # Read plugin package info from `properties.yml` file.
-            try:
-                with plugin_path_i.joinpath('properties.yml').open('r') as input_:
-                    properties_i = yaml.load(input_.read())
-            except:
-                logger.info('[warning] Could not read package info: `%s`',
-                            plugin_path_i.joinpath('properties.yml'),
-                            exc_info=True)
-            else:
-                properties_i['path'] = plugin_path_i.realpath()
-                installed_plugins_.append(properties_i)
+    cached = _installed_plugins_cache.get(only_conda)
+    if cached is not None and cached[0] == cache_key:
+        # Return copies so callers cannot modify cached properties.
+        return [dict(plugin_i) for plugin_i in cached[1]]
+
+    # Only process plugin directory if it is *not a link*.
+    entries = [entry for entry in entries
+               if entry.is_dir() and not _entry_islinklike(entry)]
+    if only_conda:
+        conda_packages = _conda_packages()
+        if conda_packages is not None:
+            # Plugin directory name is derived from the name of the plugin
+            # Conda package (e.g., `microdrop.foo-plugin` -> `foo_plugin`), so
+            # skip reading properties of plugins that cannot correspond to an
+            # installed Conda package.
+            module_names = set(name_i.split('.')[-1].replace('-', '_')
+                               for name_i in conda_packages)
+            entries = [entry for entry in entries
+                       if entry.name in module_names]
+    installed_plugins_ = _read_properties_many([entry.path
+                                                for entry in entries])
 
     if only_conda:
         # Filter for plugins installed as Conda packages
-        try:
-            package_names = [plugin_i['package_name']
-                             for plugin_i in installed_plugins_]
-            conda_package_infos = ch.package_version(package_names,
-                                                     verbose=False)
-        except ch.PackageNotFound as exception:
-            # At least one specified plugin package name did not correspond to an
-            # installed Conda package.
-            logger.warning(str(exception))
-            conda_package_infos = exception.available
+        package_names = [plugin_i['package_name']
+                         for plugin_i in installed_plugins_]
+        conda_package_infos = _installed_package_infos(package_names)
         # Extract name from each Conda plugin package.
         installed_package_names = set([package_i['name']
                                        for package_i in conda_package_infos])
-        return [plugin_i for plugin_i in installed_plugins_
-                if plugin_i['package_name'] in installed_package_names]
-    else:
-        return installed_plugins_
+        installed_plugins_ = [plugin_i for plugin_i in installed_plugins_
+                              if plugin_i['package_name'] in
+                              installed_package_names]
+
+    _installed_plugins_cache[only_conda] = (cache_key, installed_plugins_)
+    return [dict(plugin_i) for plugin_i in installed_plugins_]
 
 
 def enabled_plugins(installed_only=True):
@@ -671,49 +1322,32 @@ def enabled_plugins(installed_only=True):
         directory or a link/junction.
 
     '''
-    enabled_path = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
-    if not enabled_path.isdir():
+    try:
+        entries = os.scandir(_ENABLED)
+    except OSError:
         return []
 
     # Construct list of property dictionaries, one per enabled plugin
     # directory.
-    enabled_plugins_ = []
-    for plugin_path_i in enabled_path.dirs():
-        if not installed_only or _islinklike(plugin_path_i):
-            # Enabled plugin path is either **a link to an installed plugin**
-            # or call explicitly specifies that plugins that are not installed
-            # should still be considered.
-
-            # Read plugin package info from `properties.yml` file.
-            try:
-                with plugin_path_i.joinpath('properties.yml').open('r') as input_:
-                    properties_i = yaml.safe_load(input_.read())
-            except:
-                logger.info('[warning] Could not read package info: `%s`',
-                            plugin_path_i.joinpath('properties.yml'),
-                            exc_info=True)
-                continue
-            else:
-                properties_i['path'] = plugin_path_i.realpath()
-                enabled_plugins_.append(properties_i)
+    with entries:
+        # Enabled plugin path is either **a link to an installed plugin** or
+        # call explicitly specifies that plugins that are not installed should
+        # still be considered.
+        plugin_dirs = [entry.path for entry in entries
+                       if entry.is_dir() and (not installed_only or
+                                              _entry_islinklike(entry))]
+    enabled_plugins_ = _read_properties_many(plugin_dirs)
 
     if installed_only:
-        try:
-            # Attempt to look up installed Conda package info for each enabled
-            # plugin.
-            package_names = [properties_i['package_name']
-                             for properties_i in enabled_plugins_]
-            installed_info = ch.package_version(package_names, verbose=False)
-        except ch.PackageNotFound as exception:
-            # Failed to find a corresponding installed Conda package for at
-            # least one enabled plugin.
-            logger.warning(str(exception))
-            available_names = set([package_i['name']
-                                   for package_i in exception.available])
-            # Only return list of enabled plugins that have a corresponding
-            # Conda package installed.
-            return [properties_i for properties_i in enabled_plugins_
-                    if properties_i['package_name'] in available_names]
+        # Look up installed Conda package info for each enabled plugin.
+        package_names = [properties_i['package_name']
+                         for properties_i in enabled_plugins_]
+        available_names = set([package_i['name'] for package_i in
+                               _installed_package_infos(package_names)])
+        # Only return list of enabled plugins that have a corresponding Conda
+        # package installed.
+        return [properties_i for properties_i in enabled_plugins_
+                if properties_i['package_name'] in available_names]
 
     # Return list of all enabled plugins, regardless of whether or not they
     # have corresponding Conda packages installed.
@@ -9,7 +9,7 @@ import si_prefix as si
 
 from .. import pformat_dict
 from ..commands import (DEFAULT_INDEX_HOST, freeze, get_plugins_directory,
-                        install, SERVER_URL_TEMPLATE, uninstall, search)
+                        install_many, SERVER_URL_TEMPLATE, uninstall, search)
 from ..hooks import on_plugin_install
 
 logger = logging.getLogger(__name__)
@@ -72,16 +72,16 @@ hook_parser = subparsers.add_parser('hook', help='Execute plugin hook')
 hook_parser.add_argument('hook', choices=['on_install'], help='Plugin hook')
 hook_parser.add_argument('plugin', nargs='*')
 
+MPM_CLI_PARSER = ArgumentParser(description='MicroDrop plugin manager',
+                                parents=[MPM_PARSER])
+
 
 def parse_args(args=None):
     '''Parses arguments, returns ``(options, args)``.'''
     if args is None:
         args = sys.argv[1:]
 
-    parser = ArgumentParser(description='MicroDrop plugin manager',
-                            parents=[MPM_PARSER])
-
-    return parser.parse_args()
+    return MPM_CLI_PARSER.parse_args(args)
 
 
 def validate_args(args):
@@ -154,11 +154,11 @@ def main(args=None):
             args.plugin = [line.strip() for line in
                            args.requirements_file.lines()
                            if not line.startswith('#')]
-        for plugin_i in args.plugin:
+        for plugin_i, future_i in install_many(args.plugin,
+                                               args.plugins_directory,
+                                               server_url=args.server_url):
             try:
-                path_i, meta_i = install(plugin_package=plugin_i,
-                                         plugins_directory=args.plugins_directory,
-                                         server_url=args.server_url)
+                path_i, meta_i = future_i.result()
                 if not args.no_on_install:
                     on_plugin_install(path_i)
             except KeyError as exception:
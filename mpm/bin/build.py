@@ -1,15 +1,31 @@
 import argparse
+import functools
+import json
 import logging
 import os
+import re
 import subprocess
 import sys
-import zipfile
+import tarfile
+import tempfile
 from microdrop_libs.path_helpers import path
-import yaml
-from shutil import rmtree
 
 logger = logging.getLogger(__name__)
 
+# Buffer size used for reading and extracting git archive.
+ARCHIVE_BUFSIZE = 1 << 20
+
+
+BUILD_PARSER = argparse.ArgumentParser(description='MicroDrop plugin Conda '
+                                       'recipe builder')
+BUILD_PARSER.add_argument('-s', '--source-dir', type=path, nargs='?')
+BUILD_PARSER.add_argument('-t', '--target-dir', type=path, nargs='?')
+BUILD_PARSER.add_argument('-p', '--package-name', nargs='?')
+# Use `-V` for version (from [common Unix flags][1]).
+#
+# [1]: https://unix.stackexchange.com/a/108141/187716
+BUILD_PARSER.add_argument('-V', '--version-number', nargs='?')
+
 
 def parse_args(args=None):
     """
@@ -20,16 +36,7 @@ def parse_args(args=None):
     if args is None:
         args = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(description='MicroDrop plugin Conda recipe builder')
-    parser.add_argument('-s', '--source-dir', type=path, nargs='?')
-    parser.add_argument('-t', '--target-dir', type=path, nargs='?')
-    parser.add_argument('-p', '--package-name', nargs='?')
-    # Use `-V` for version (from [common Unix flags][1]).
-    #
-    # [1]: https://unix.stackexchange.com/a/108141/187716
-    parser.add_argument('-V', '--version-number', nargs='?')
-
-    parsed_args = parser.parse_args()
+    parsed_args = BUILD_PARSER.parse_args(args)
     if not parsed_args.source_dir:
         parsed_args.source_dir = path(os.environ['SRC_DIR'])
     if not parsed_args.target_dir:
@@ -49,6 +56,212 @@ def parse_args(args=None):
     return parsed_args
 
 
+def _yaml_scalar(value):
+    '''
+    Parameters
+    ----------
+    value : str
+        Scalar value.
+
+    Returns
+    -------
+    str
+        Value as a double-quoted YAML scalar.
+
+        Double-quoted YAML scalars are a superset of JSON strings, so special
+        characters are escaped using JSON string encoding.  Quoting also
+        ensures values such as ``1.0`` are loaded as strings.
+    '''
+    return json.dumps(str(value))
+
+
+def _abspath(path_):
+    '''
+    Parameters
+    ----------
+    path_ : str
+        File system path.
+
+    Returns
+    -------
+    path
+        Absolute path.
+
+        Path is normalized lexically, and only resolved (i.e., ``realpath``)
+        if the path itself is a symbolic link.
+    '''
+    path_ = path(os.path.abspath(path_))
+    return path_.realpath() if path_.islink() else path_
+
+
+def _exclude_member(member):
+    '''
+    Parameters
+    ----------
+    member : tarfile.TarInfo
+        Member of git archive.
+
+    Returns
+    -------
+    bool
+        ``True`` if member should not be included in the plugin release, i.e.,
+        Conda build recipe (``.conda-recipe/*``), ``bld.bat``, or top-level
+        git files (e.g., ``.gitignore``, ``.gitattributes``).
+    '''
+    name = member.name.rstrip('/')
+    if name == '.conda-recipe' or name.startswith('.conda-recipe/'):
+        return True
+    return '/' not in name and (name == 'bld.bat' or
+                                (name.startswith('.git') and
+                                 not member.isdir()))
+
+
+@functools.lru_cache(maxsize=1)
+def _import_pygit2():
+    '''
+    Returns
+    -------
+    module or None
+        :mod:`pygit2` module, or ``None`` if not available.
+
+        Imported on first use (i.e., only when building) to keep import of
+        this module (e.g., by command-line entry points) fast.
+    '''
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+
+@functools.lru_cache(maxsize=None)
+def _pygit2_repository(source_dir):
+    '''
+    Parameters
+    ----------
+    source_dir : str
+        Source directory.
+
+    Returns
+    -------
+    pygit2.Repository
+        Repository containing source directory.
+
+        Repository is opened once and reused by subsequent builds from the
+        same source directory.
+    '''
+    return _import_pygit2().Repository(source_dir)
+
+
+def _pygit2_archive(source_dir):
+    '''
+    Export ``HEAD`` of source directory repository as ``tar`` archive
+    in-process (i.e., without running ``git``), using :mod:`pygit2` (if
+    available).
+
+    Parameters
+    ----------
+    source_dir : path
+        Source directory.
+
+    Returns
+    -------
+    tempfile.SpooledTemporaryFile or None
+        ``tar`` archive (positioned at start), or ``None`` if :mod:`pygit2` is
+        not available or the archive requires ``git archive`` (i.e., any
+        ``export-subst`` or ``export-ignore`` attributes are set).
+    '''
+    pygit2 = _import_pygit2()
+    if pygit2 is None:
+        return None
+
+    try:
+        repo = _pygit2_repository(str(source_dir))
+        commit = repo.revparse_single('HEAD').peel(pygit2.Commit)
+    except (KeyError, pygit2.GitError):
+        return None
+    if repo.workdir is None or path(repo.workdir).realpath() != \
+            source_dir.realpath():
+        # `git archive` only exports the current subdirectory of a work tree.
+        return None
+
+    # `write_archive` does not apply git attributes, so fall back to
+    # `git archive` if any export attributes are set (e.g., versioneer sets
+    # `export-subst` for `_version.py`).
+    cre_export = re.compile(rb'export-(subst|ignore)')
+    index = pygit2.Index()
+    index.read_tree(commit.tree)
+    attributes = [repo[entry_i.id].data for entry_i in index
+                  if entry_i.path.rsplit('/', 1)[-1] == '.gitattributes']
+    info_attributes = path(repo.path).joinpath('info', 'attributes')
+    if info_attributes.isfile():
+        attributes.append(info_attributes.bytes())
+    if any(cre_export.search(data_i) for data_i in attributes):
+        return None
+
+    archive = tempfile.SpooledTemporaryFile(max_size=64 << 20)
+    with tarfile.open(fileobj=archive, mode='w|',
+                      bufsize=ARCHIVE_BUFSIZE) as tar:
+        repo.write_archive(commit, tar)
+    archive.seek(0)
+    return archive
+
+
+def _extract_tar_stream(tar, target_dir, exclude=None):
+    '''
+    Extract all members of streamed tar archive to target directory.
+
+    Parameters
+    ----------
+    tar : tarfile.TarFile
+        Tar archive opened in streaming mode (e.g., ``r|``).
+    target_dir : str
+        Target directory.
+    exclude : function, optional
+        Function returning ``True`` for each member (i.e.,
+        :class:`tarfile.TarInfo`) that should **not** be extracted.
+    '''
+    members = (member for member in tar
+               if exclude is None or not exclude(member))
+    # Reject absolute paths, links outside of target directory, etc. (if
+    # extraction filters are supported).
+    tar.extractall(target_dir, members=members,
+                   **({'filter': 'data'} if hasattr(tarfile, 'data_filter')
+                      else {}))
+
+
+def _git_archive(source_dir, target_dir):
+    '''
+    Export ``HEAD`` of source directory repository using ``git archive`` and
+    extract to target directory.
+
+    Parameters
+    ----------
+    source_dir : path
+        Source directory.
+    target_dir : path
+        Target directory.
+    '''
+    # Export git archive, which substitutes version expressions in
+    # `_version.py` to reflect the state (i.e., revision and tag info) of the
+    # git repository.
+    process = subprocess.Popen(['git', 'archive', '--format=tar', 'HEAD'],
+                               cwd=str(source_dir), stdout=subprocess.PIPE,
+                               bufsize=ARCHIVE_BUFSIZE)
+    with process.stdout:
+        # Extract exported git archive to Conda MicroDrop plugins directory.
+        #
+        # Use streaming mode (i.e., `r|`) to extract members as they are read
+        # from the pipe.  Use large buffers to reduce the number of read and
+        # write calls.
+        with tarfile.open(fileobj=process.stdout, mode='r|',
+                          bufsize=ARCHIVE_BUFSIZE,
+                          copybufsize=ARCHIVE_BUFSIZE) as tar:
+            _extract_tar_stream(tar, target_dir, exclude=_exclude_member)
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, process.args)
+
+
 def build(source_dir, target_dir, package_name=None, version_number=None):
     """
         Create a release of a MicroDrop plugin source directory in the target
@@ -62,6 +275,16 @@ def build(source_dir, target_dir, package_name=None, version_number=None):
             Change directory into source directory before running ``git archive``.
         .. versionchanged:: 0.25
             Add optional :data:`version_number` argument.
+
+        Git archive is streamed as an uncompressed ``tar`` directly into the
+        target directory, rather than written to a ``.zip`` file in the
+        source directory.
+
+        If :mod:`pygit2` is available (and no ``export-subst`` or
+        ``export-ignore`` git attributes are set), the archive is exported
+        in-process using a repository object that is reused across builds,
+        rather than running ``git archive``.
+
         Parameters
         ----------
         source_dir : str
@@ -75,59 +298,41 @@ def build(source_dir, target_dir, package_name=None, version_number=None):
             If not specified, assume version package exposes version using
             `versioneer <https://github.com/warner/python-versioneer>`_.
     """
-    source_dir = path(source_dir).realpath()
-    target_dir = path(target_dir).realpath()
+    source_dir = _abspath(source_dir)
+    target_dir = _abspath(target_dir)
     target_dir.makedirs_p()
-    source_archive = source_dir.joinpath(source_dir.name + '.zip')
     if package_name is None:
         package_name = str(target_dir.name)
     logger.info('Source directory: %s', source_dir)
-    logger.info('Source archive: %s', source_archive)
     logger.info('Target directory: %s', target_dir)
     logger.info('Package name: %s', package_name)
 
-    # Export git archive, which substitutes version expressions in
-    # `_version.py` to reflect the state (i.e., revision and tag info) of the
-    # git repository.
-    original_dir = path(os.getcwd())
-    try:
-        os.chdir(source_dir)
-        subprocess.check_call(['git', 'archive', '-o', source_archive, 'HEAD'], shell=True)
-    finally:
-        os.chdir(original_dir)
-
-    # Extract exported git archive to Conda MicroDrop plugins directory.
-    with zipfile.ZipFile(source_archive, 'r') as zip_ref:
-        zip_ref.extractall(target_dir)
-    # Extraction is complete.  Remove temporary archive.
-    source_archive.remove()
-
-    # Delete Conda build recipe from installed package.
-    target_dir.joinpath('.conda-recipe').rmtree()
-    # Delete Conda build recipe from installed package.
-    for p in target_dir.files('.git*'):
-        p.remove()
+    archive = _pygit2_archive(source_dir)
+    if archive is not None:
+        logger.debug('Export archive using pygit2')
+        with archive:
+            with tarfile.open(fileobj=archive, mode='r|',
+                              bufsize=ARCHIVE_BUFSIZE,
+                              copybufsize=ARCHIVE_BUFSIZE) as tar:
+                _extract_tar_stream(tar, target_dir, exclude=_exclude_member)
+    else:
+        _git_archive(source_dir, target_dir)
 
     # Write package information to (legacy) `properties.yml` file.
-    original_dir = path(os.getcwd())
-    try:
-        os.chdir(source_dir)
-        if version_number is None:
-            # TODO: Fix with versioneer
-            version_info = {'version': '0.1.alpha'}
-        else:
-            version_info = {'version': version_number}
-    finally:
-        os.chdir(original_dir)
+    if version_number is None:
+        # TODO: Fix with versioneer
+        version_info = {'version': '0.1.alpha'}
+    else:
+        version_info = {'version': version_number}
 
     properties = {'package_name': package_name, 'plugin_name': str(target_dir.name)}
     properties.update(version_info)
 
     with target_dir.joinpath('properties.yml').open('w') as properties_yml:
-        # Dump properties to YAML-formatted file.
-        # Setting `default_flow_style=False` writes each property on a separate
-        # line (cosmetic change only).
-        yaml.dump(properties, properties_yml, default_flow_style=False)
+        # Write properties to YAML-formatted file, one property per line.
+        properties_yml.write(''.join('{}: {}\n'.format(key, _yaml_scalar(value))
+                                     for key, value in
+                                     sorted(properties.items())))
 
 
 def main(args=None):
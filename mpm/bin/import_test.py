@@ -5,6 +5,11 @@ from ..api import import_plugin
 
 logger = logging.getLogger(__name__)
 
+IMPORT_TEST_PARSER = argparse.ArgumentParser(description='MicroDrop plugin import test')
+IMPORT_TEST_PARSER.add_argument('package_name', help='Plugin Conda package name')
+IMPORT_TEST_PARSER.add_argument('-a', '--include-available', action='store_true',
+                                help='Include all available plugins (not just enabled ones).')
+
 def parse_args(args=None):
     """Parses command-line arguments, returns the parsed arguments."""
     # The original code had `args = sys.argv` which includes the script name as the first argument.
@@ -13,12 +18,7 @@ def parse_args(args=None):
     if args is None:
         args = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(description='MicroDrop plugin import test')
-    parser.add_argument('package_name', help='Plugin Conda package name')
-    parser.add_argument('-a', '--include-available', action='store_true',
-                        help='Include all available plugins (not just enabled ones).')
-
-    parsed_args = parser.parse_args(args)
+    parsed_args = IMPORT_TEST_PARSER.parse_args(args)
     return parsed_args
 
 def main(cli_args=None):
@@ -1,5 +1,8 @@
 import argparse
+import concurrent.futures
+import io
 import logging
+import os
 import sys
 from microdrop_libs.path_helpers import path
 
@@ -12,6 +15,10 @@ logger = logging.getLogger(__name__)
 default_plugins_directory = get_plugins_directory()
 
 INSTALL_REQUIREMENTS_PARSER = argparse.ArgumentParser(add_help=False, parents=[LOG_PARSER, PLUGINS_DIR_PARSER])
+INSTALL_DEPENDENCIES_PARSER = argparse.ArgumentParser(description='MicroDrop plugin dependencies installer', parents=[INSTALL_REQUIREMENTS_PARSER])
+INSTALL_DEPENDENCIES_PARSER.add_argument('--parallel', action='store_true',
+                                         help='Run plugin hooks concurrently (only safe if hooks do not '
+                                              'modify the same Conda environment).')
 
 
 def validate_args(args):
@@ -29,31 +36,59 @@ def validate_args(args):
     return args
 
 
-def install_dependencies(plugins_directory, ostream=sys.stdout):
+def install_dependencies(plugins_directory, ostream=sys.stdout, parallel=False):
     '''
     Run "on_plugin_install" script for each plugin directory found in
     the specified plugins directory.
 
+    Scripts are run one at a time by default, since hooks typically install
+    packages into the same Conda environment.
+
     Parameters
     ----------
     plugins_directory : path or str
         File system path to directory containing zero or more plugin subdirectories.
     ostream : file-like
         Output stream for status messages (default: sys.stdout).
+    parallel : bool, optional
+        If ``True``, run scripts concurrently.  The output of each script is
+        buffered and written to :data:`ostream` in plugin order.
     '''
-    plugin_directories = plugins_directory.realpath().dirs()
-
-    print('*' * 50, file=ostream)
-    print('Processing plugins:', file=ostream)
-    print('\n'.join(['  - {}'.format(p) for p in plugin_directories]), file=ostream)
-    print('\n' + '-' * 50 + '\n', file=ostream)
-
-    for plugin_dir_i in plugin_directories:
+    plugins_directory = path(os.path.abspath(plugins_directory))
+    # Use `os.scandir` so directory checks use the cached entry type, rather
+    # than a `stat` per entry.  Note that symbolic links (e.g., enabled
+    # plugins) to directories are followed.
+    with os.scandir(plugins_directory) as entries:
+        plugin_directories = [path(entry_i.path) for entry_i in entries
+                              if entry_i.is_dir()]
+
+    separator = f'\n{"-" * 50}\n\n'
+    # Write each block of output with a single call.
+    ostream.write(f'{"*" * 50}\nProcessing plugins:\n'
+                  + '\n'.join(f'  - {p}' for p in plugin_directories)
+                  + f'\n{separator}')
+
+    def _install(plugin_dir, output):
         try:
-            on_plugin_install(str(plugin_dir_i), ostream=ostream)
+            on_plugin_install(str(plugin_dir), ostream=output)
         except RuntimeError as exception:
-            print(exception, file=ostream)
-        print('\n' + '-' * 50 + '\n', file=ostream)
+            print(exception, file=output)
+
+    if not parallel:
+        for plugin_dir_i in plugin_directories:
+            _install(plugin_dir_i, ostream)
+            ostream.write(separator)
+        return
+
+    def _install_buffered(plugin_dir):
+        output = io.StringIO()
+        _install(plugin_dir, output)
+        return output.getvalue()
+
+    max_workers = max(1, min(8, len(plugin_directories)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        for output_i in executor.map(_install_buffered, plugin_directories):
+            ostream.write(output_i + separator)
 
 
 def parse_args(args=None):
@@ -61,15 +96,14 @@ def parse_args(args=None):
     if args is None:
         args = sys.argv[1:]  # Exclude the script name from the arguments.
 
-    parser = argparse.ArgumentParser(description='MicroDrop plugin dependencies installer', parents=[INSTALL_REQUIREMENTS_PARSER])
-    return parser.parse_args(args)
+    return INSTALL_DEPENDENCIES_PARSER.parse_args(args)
 
 
 def main(cli_args=None):
     args = parse_args(cli_args)
     args = validate_args(args)
     logger.debug('Arguments: %s', args)
-    install_dependencies(args.plugins_directory)
+    install_dependencies(args.plugins_directory, parallel=args.parallel)
 
 
 if __name__ == '__main__':
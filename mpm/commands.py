@@ -9,32 +9,78 @@ Inspired by `pip`.
     mpm uninstall <plugin-name>
     mpm freeze
 '''
+from collections import OrderedDict
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import io
 import logging
 import os
-import tempfile as tmp
+import queue
+import re
+import shutil
+import stat
+import sys
+import time
 from microdrop_libs.path_helpers import path
 from microdrop import configobj_micro as configobj
-import progressbar
 import requests
 import tarfile
-import yaml
+from tqdm import tqdm
+
+from ._yaml import load_properties, safe_load
 
 # TODO: Replace usage of pip helpers if possible
 from microdrop_libs.pip_helpers import CRE_PACKAGE, get_releases
 
+# Bind match method of (precompiled) plugin descriptor pattern once.
+_match_package = CRE_PACKAGE.match
+# Top-level, quoted `version` value in `properties.yml`.
+_CRE_QUICK_VERSION = re.compile(rb'^version:[ \t]*(?:"([^"\\\r\n]*)"|'
+                                rb"'([^'\r\n]*)')[ \t]*\r?$", re.M)
+
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+try:
+    from zlib_ng import gzip_ng
+except ImportError:
+    gzip_ng = None
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_INDEX_HOST = r'http://microfluidics.utoronto.ca/update'
 SERVER_URL_TEMPLATE = r'%s/plugins/{}/json/'
 DEFAULT_SERVER_URL = SERVER_URL_TEMPLATE % DEFAULT_INDEX_HOST
-
-
+#: Minimum size of (seekable) archive to decompress in parallel.
+PARALLEL_GZIP_MIN_BYTES = 16 << 20
+#: Buffer size used for reading and extracting plugin archives.
+ARCHIVE_BUFSIZE = 1 << 20
+#: Size of chunks read from plugin archive downloads.
+DOWNLOAD_CHUNK_SIZE = 64 << 10
+#: Name of file (in plugin directory) containing SHA-256 digest of archive
+#: plugin was installed from.
+DIGEST_FILENAME = '.mpm_sha256'
+#: Maximum number of plugins to install concurrently.
+MAX_INSTALL_WORKERS = 8
+#: Number of seconds plugin index lookups are cached for.
+RELEASES_CACHE_TTL = 5 * 60
+
+# Results of `get_releases()` and time of lookup, keyed by
+# `(plugin_package, server_url)`.
+_releases_cache = {}
+
+
+@functools.lru_cache(maxsize=1)
 def home_dir():
     """
     Returns:
 
         str : path to home directory (or ``Documents`` directory on Windows).
+
+    Result is cached (call ``home_dir.cache_clear()`` to reset).
     """
     if os.name == 'nt':
         from win32comext.shell import shell, shellcon
@@ -44,6 +90,57 @@ def home_dir():
         return os.path.expanduser('~')
 
 
+def _get_releases(plugin_package, server_url=DEFAULT_SERVER_URL):
+    '''
+    Look up releases matching plugin descriptor using
+    ``pip_helpers.get_releases``.
+
+    Results are cached in-process for :data:`RELEASES_CACHE_TTL` seconds,
+    unless the ``MPM_NO_CACHE`` environment variable is set.
+
+    Parameters
+    ----------
+    plugin_package : str
+        Plugin package descriptor, e.g., ``"foo"``, ``"foo>=1.0"``.
+    server_url : str
+        URL of JSON request for MicroDrop plugins package index.
+
+    Returns
+    -------
+    (str, OrderedDict)
+        Name of found plugin and mapping of version strings to plugin package
+        metadata dictionaries (in increasing version order).
+    '''
+    if os.environ.get('MPM_NO_CACHE'):
+        return get_releases(plugin_package, server_url=server_url)
+
+    key = (plugin_package, server_url)
+    cached = _releases_cache.get(key)
+    if cached is not None and \
+            time.monotonic() - cached[0] < RELEASES_CACHE_TTL:
+        name, releases = cached[1]
+    else:
+        name, releases = get_releases(plugin_package, server_url=server_url)
+        _releases_cache[key] = (time.monotonic(), (name, releases))
+    return name, OrderedDict(releases)
+
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    '''
+    Returns
+    -------
+    requests.Session
+        HTTP session shared by plugin archive downloads (e.g., to reuse
+        connections across concurrent installs).
+    '''
+    session = requests.sessions.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_INSTALL_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 def get_plugins_directory(config_path=None, microdrop_user_root=None):
     '''
     Resolve plugins directory.
@@ -73,6 +170,9 @@ def get_plugins_directory(config_path=None, microdrop_user_root=None):
     -------
     path
         Absolute path to plugins directory.
+
+        Contents of configuration file are cached until the file is
+        modified.
     '''
     RESOLVED_BY_NONE = 'default'
     RESOLVED_BY_CONFIG_ARG = 'config_path argument'
@@ -103,8 +203,13 @@ def get_plugins_directory(config_path=None, microdrop_user_root=None):
 
     try:
         # Look up plugins directory stored in configuration file.
-        plugins_directory = path(configobj.ConfigObj(config_path)
-                                 ['plugins']['directory'])
+        try:
+            config_stat = os.stat(config_path)
+            config_key = (config_stat.st_mtime_ns, config_stat.st_size)
+        except OSError:
+            config_key = None
+        plugins_directory = \
+            path(_configured_plugins_directory(config_path, config_key))
         if not plugins_directory.isabs():
             # Plugins directory stored in configuration file as relative path.
             # Interpret as relative to parent directory of configuration file.
@@ -125,6 +230,62 @@ def get_plugins_directory(config_path=None, microdrop_user_root=None):
     return plugins_directory
 
 
+@functools.lru_cache(maxsize=32)
+def _configured_plugins_directory(config_path, config_key):
+    '''
+    Parameters
+    ----------
+    config_path : path
+        Configuration file path (i.e., path to ``microdrop.ini``).
+    config_key : tuple or None
+        ``(mtime, size)`` of configuration file, used to invalidate cached
+        result when the file is modified.
+
+    Returns
+    -------
+    str
+        Plugins directory as stored in configuration file.
+
+    Raises
+    ------
+    KeyError
+        If no plugins directory is set in configuration file.
+    '''
+    return configobj.ConfigObj(config_path)['plugins']['directory']
+
+
+def _rmtree(path_, ignore_missing=False):
+    '''
+    Recursively delete directory tree.
+
+    Read-only files and directories (e.g., vendored plugin files on Windows)
+    are made writable and removal is retried.
+
+    Parameters
+    ----------
+    path_ : str
+        Directory path.
+    ignore_missing : bool, optional
+        If ``True``, do nothing if directory does not exist.
+    '''
+    def _on_error(function, path_i, exception):
+        if not isinstance(exception, BaseException):
+            # `onerror` handler is passed `sys.exc_info()` tuple.
+            exception = exception[1]
+        if ignore_missing and isinstance(exception, FileNotFoundError):
+            return
+        if function not in (os.unlink, os.remove, os.rmdir) or \
+                not isinstance(exception, PermissionError):
+            raise exception
+        os.chmod(path_i, stat.S_IWRITE)
+        function(path_i)
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path_, onexc=_on_error)
+    else:
+        shutil.rmtree(path_, onerror=_on_error)
+
+
 def plugin_request(plugin_str):
     """
     Extract plugin name and version specifiers from plugin descriptor string.
@@ -135,14 +296,15 @@ def plugin_request(plugin_str):
         .. _sci-bots/mpm#5: https://github.com/sci-bots/mpm/issues/5
     """
 
-    match = CRE_PACKAGE.match(plugin_str)
+    match = _match_package(plugin_str)
     if not match:
         raise ValueError('Invalid plugin descriptor. Must be like "foo", '
                          '"foo==1.0", "foo>=1.0", etc.')
     return match.groupdict()
 
 
-def install(plugin_package, plugins_directory, server_url=DEFAULT_SERVER_URL):
+def install(plugin_package, plugins_directory, server_url=DEFAULT_SERVER_URL,
+            session=None, position=None):
     """
     Parameters
     ----------
@@ -156,6 +318,12 @@ def install(plugin_package, plugins_directory, server_url=DEFAULT_SERVER_URL):
     server_url : str
         URL of JSON request for MicroDrop plugins package index.  See
         ``DEFAULT_SERVER_URL`` for default.
+    session : requests.Session, optional
+        HTTP session used to download plugin archive (default: session
+        shared by all installs in this process, reusing connections).
+    position : int, optional
+        Line offset of download progress bar (e.g., to avoid overlapping
+        progress bars of concurrent installs).
 
     Returns
     -------
@@ -175,86 +343,302 @@ def install(plugin_package, plugins_directory, server_url=DEFAULT_SERVER_URL):
 
 
     plugins_directory = path(plugins_directory)
-    if path(plugin_package).isfile():
+    if os.path.isfile(plugin_package):
         plugin_is_file = True
         with open(plugin_package, 'rb') as plugin_file:
             # Plugin package is a file.
             plugin_file_metadata = extract_metadata(plugin_file)
+            digest = _sha256(plugin_file)
         name = plugin_file_metadata['package_name']
         version = plugin_file_metadata['version']
     else:
         plugin_is_file = False
         # Look up latest release matching specifiers.
         try:
-            name, releases = get_releases(plugin_package,
+            name, releases = _get_releases(plugin_package,
                                           server_url=server_url)
             version, release = list(releases.items())[-1]
         except KeyError:
             raise
+        # Use archive digest from package index (if available).
+        digest = release.get('sha256_digest') or \
+            (release.get('digests') or {}).get('sha256')
 
     # Check existing version (if any).
-    try:
-        plugin_path = plugins_directory.joinpath(name)
-    except:
-        plugin_path = path(plugins_directory).joinpath(name)
+    plugin_path = plugins_directory / name
+
+    if digest is not None and digest == _installed_digest(plugin_path):
+        # Package already installed from identical archive.
+        raise ValueError('`{}=={}` is already installed.'.format(name,
+                                                                 version))
 
     if not plugin_path.isdir():
         existing_version = None
     else:
-        plugin_metadata = yaml.safe_load(plugin_path.joinpath('properties.yml')
-                                         .read_text())
-        existing_version = plugin_metadata['version']
+        properties_path = os.path.join(plugin_path, 'properties.yml')
+        existing_version = _quick_version(properties_path)
+        if existing_version is None:
+            plugin_metadata = load_properties(properties_path)
+            existing_version = plugin_metadata['version']
 
     if version == existing_version:
         # Package already installed.
         raise ValueError('`{}=={}` is already installed.'.format(name,
                                                                  version))
 
-    if existing_version is not None:
-        # Uninstall existing package.
-        uninstall(name, str(plugins_directory))
-
     # Assuming 'name' and 'version' variables are defined
     print(f'Installing `{name}=={version}`.')
 
+    # Extract plugin to sibling directory on the same file system.  Existing
+    # plugin (if any) is only replaced once the new version is extracted and
+    # validated.
+    new_path = plugin_path + '.new'
+    _rmtree(new_path, ignore_missing=True)
+
     if not plugin_is_file:
-        # Download plugin release archive.
-        download = requests.get(release['url'], stream=True)
-
-        # Use io.BytesIO for a bytes buffer
-        plugin_archive_bytes = io.BytesIO()
-        total_bytes = int(download.headers.get('Content-Length'))
-        bytes_read = 0
-
-        # Set up the progress bar
-        with progressbar.ProgressBar(max_value=total_bytes) as bar:
-            for chunk in download.iter_content(chunk_size=1024):
-                if chunk:  # filter out keep-alive chunks
-                    bytes_read += len(chunk)
-                    plugin_archive_bytes.write(chunk)
-                    bar.update(bytes_read)
-
-        # Reset the stream position to the beginning before reading from it
-        plugin_archive_bytes.seek(0)
+        # Download plugin release archive, extracting contents as they are
+        # received (i.e., without buffering the archive in memory).
+        download = (session or _session()).get(release['url'], stream=True)
+        # Compute digest while downloading (if not provided by index).
+        sha256 = hashlib.sha256() if digest is None else None
+        with download:
+            download.raw.decode_content = True
+            total_bytes = download.headers.get('Content-Length')
+            new_path, plugin_metadata = \
+                _install_stream(download.raw, new_path,
+                                total_bytes=int(total_bytes) if total_bytes
+                                else None, hash_=sha256,
+                                position=position, desc=name)
+        if sha256 is not None:
+            digest = sha256.hexdigest()
     else:
         # Open the plugin package as a binary file
-        plugin_archive_bytes = open(plugin_package, 'rb')
+        with open(plugin_package, 'rb') as plugin_archive:
+            new_path, plugin_metadata = install_fileobj(plugin_archive,
+                                                        new_path)
 
-    # Assuming 'install_fileobj', 'plugin_path', and 'plugin_metadata' functions or variables are defined
-    plugin_path, plugin_metadata = install_fileobj(plugin_archive_bytes, plugin_path)
+    try:
+        # Ensure installed package and version match the requested version
+        assert plugin_metadata['package_name'] == name and plugin_metadata['version'] == version, "Version mismatch error."
+        with open(os.path.join(new_path, DIGEST_FILENAME), 'w') as output:
+            output.write(digest)
+    except:
+        _rmtree(new_path)
+        raise
 
-    # Ensure installed package and version match the requested version
-    assert plugin_metadata['package_name'] == name and plugin_metadata['version'] == version, "Version mismatch error."
+    if existing_version is not None:
+        # Replace existing package.
+        print('Uninstalling `{}=={}`.'.format(name, existing_version))
+        old_path = plugin_path + '.old'
+        _rmtree(old_path, ignore_missing=True)
+        os.replace(plugin_path, old_path)
+        try:
+            os.replace(new_path, plugin_path)
+        except Exception:
+            # Restore previously installed version.
+            os.replace(old_path, plugin_path)
+            raise
+        _rmtree(old_path)
+    else:
+        os.replace(new_path, plugin_path)
 
     print("  \--> done")
 
-    # Close the file object
-    plugin_archive_bytes.close()
-
     # Assuming 'plugin_path' and 'plugin_metadata' are used further
     return plugin_path, plugin_metadata
 
 
+def _quick_version(properties_path):
+    '''
+    Read plugin version from ``properties.yml`` without parsing YAML.
+
+    Parameters
+    ----------
+    properties_path : str
+        Path to ``properties.yml`` file.
+
+    Returns
+    -------
+    str or None
+        Version, if found as a top-level quoted value (e.g., as written by
+        ``mpm.bin.build``) in the first 4 KiB of the file.  Otherwise,
+        ``None`` (i.e., fall back to parsing YAML).
+    '''
+    try:
+        with open(properties_path, 'rb') as input_:
+            head = input_.read(4096)
+    except OSError:
+        return None
+    matches = _CRE_QUICK_VERSION.findall(head)
+    if len(matches) != 1 or head.startswith(b'%'):
+        # Missing, duplicate (YAML uses last value), or YAML directives.
+        return None
+    double_quoted, single_quoted = matches[0]
+    try:
+        return (double_quoted or single_quoted).decode('utf8')
+    except UnicodeDecodeError:
+        return None
+
+
+def _remaining_bytes(fileobj):
+    '''
+    Parameters
+    ----------
+    fileobj : file-like
+        File object.
+
+    Returns
+    -------
+    int
+        Number of bytes from start of seekable file object to end, or ``-1``
+        if file object is not seekable or is not positioned at the start.
+    '''
+    if not getattr(fileobj, 'seekable', lambda: False)() or fileobj.tell():
+        return -1
+    size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    return size
+
+
+@contextlib.contextmanager
+def _open_tar(fileobj, bufsize=ARCHIVE_BUFSIZE):
+    '''
+    Open gzip-compressed tar archive for reading in streaming mode.
+
+    Seekable archives of at least :data:`PARALLEL_GZIP_MIN_BYTES` are
+    decompressed in parallel using ``rapidgzip``, if available.  Otherwise,
+    use ``zlib-ng`` to decompress archive, if available.
+
+    Parameters
+    ----------
+    fileobj : file-like
+        Gzip-compressed tar archive file object.
+    bufsize : int, optional
+        Size of blocks read from :data:`fileobj` (if decompressing using
+        :mod:`tarfile`) or from decompressed stream.  Members are extracted
+        using buffers of :data:`ARCHIVE_BUFSIZE` bytes.
+
+    Yields
+    ------
+    tarfile.TarFile
+        Tar archive.
+    '''
+    if rapidgzip is not None and \
+            _remaining_bytes(fileobj) >= PARALLEL_GZIP_MIN_BYTES:
+        # `rapidgzip` requires random access to index the compressed stream.
+        with rapidgzip.open(fileobj, parallelization=os.cpu_count() or 1) \
+                as gzip_fileobj:
+            with tarfile.open(mode='r|', fileobj=gzip_fileobj,
+                              bufsize=bufsize,
+                              copybufsize=ARCHIVE_BUFSIZE) as tar:
+                yield tar
+    elif gzip_ng is None:
+        with tarfile.open(mode='r|gz', fileobj=fileobj, bufsize=bufsize,
+                          copybufsize=ARCHIVE_BUFSIZE) as tar:
+            yield tar
+    else:
+        with gzip_ng.open(fileobj, 'rb') as gzip_fileobj:
+            with tarfile.open(mode='r|', fileobj=gzip_fileobj,
+                              bufsize=bufsize,
+                              copybufsize=ARCHIVE_BUFSIZE) as tar:
+                yield tar
+
+
+def install_many(plugin_packages, plugins_directory,
+                 server_url=DEFAULT_SERVER_URL, max_workers=None,
+                 session=None):
+    '''
+    Install multiple plugins concurrently.
+
+    Parameters
+    ----------
+    plugin_packages : list
+        Plugin package descriptors (see :func:`install`).
+    plugins_directory : str
+        path to MicroDrop user plugins directory.
+    server_url : str
+        URL of JSON request for MicroDrop plugins package index.  See
+        ``DEFAULT_SERVER_URL`` for default.
+    max_workers : int, optional
+        Maximum number of concurrent installs (default:
+        :data:`MAX_INSTALL_WORKERS`).
+    session : requests.Session, optional
+        HTTP session shared by all downloads (see :func:`install`).
+
+    Yields
+    ------
+    (str, concurrent.futures.Future)
+        Plugin package descriptor and future for result of :func:`install`,
+        in order of completion.
+
+    Notes
+    -----
+    Only the first descriptor for each plugin name is installed; duplicates
+    are skipped (concurrent installs of the same plugin would share the same
+    temporary directories).
+    '''
+    unique_packages = OrderedDict()
+    for plugin_i in plugin_packages:
+        key_i = _plugin_key(plugin_i)
+        if key_i in unique_packages:
+            logger.warning('Skipping `%s` (plugin already requested as `%s`).',
+                           plugin_i, unique_packages[key_i])
+        else:
+            unique_packages[key_i] = plugin_i
+    plugin_packages = list(unique_packages.values())
+    if not plugin_packages:
+        return
+    if max_workers is None:
+        max_workers = min(MAX_INSTALL_WORKERS, len(plugin_packages))
+    # Initialize shared state before starting worker threads.
+    if session is None:
+        session = _session()
+
+    # Assign each running install its own progress bar line.
+    positions = queue.Queue()
+    for position_i in range(max_workers):
+        positions.put(position_i)
+
+    def _install(plugin_package):
+        position = positions.get()
+        try:
+            return install(plugin_package, plugins_directory,
+                           server_url=server_url, session=session,
+                           position=position)
+        finally:
+            positions.put(position)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = {executor.submit(_install, plugin_i): plugin_i
+                   for plugin_i in plugin_packages}
+        for future_i in concurrent.futures.as_completed(futures):
+            yield futures[future_i], future_i
+
+
+def _plugin_key(plugin_package):
+    '''
+    Parameters
+    ----------
+    plugin_package : str
+        Plugin package descriptor or path to plugin archive file.
+
+    Returns
+    -------
+    str
+        Plugin name (lower case) if available, otherwise descriptor itself.
+    '''
+    try:
+        if os.path.isfile(plugin_package):
+            with open(plugin_package, 'rb') as plugin_file:
+                name = extract_metadata(plugin_file)['package_name']
+        else:
+            name = plugin_request(plugin_package)['name']
+    except Exception:
+        # Invalid descriptor/archive; error is reported by `install()`.
+        return plugin_package
+    return name.lower()
+
+
 def extract_metadata(fileobj):
     '''
     Extract metadata from plugin archive file-like object (e.g., opened file,
@@ -269,32 +653,171 @@ def extract_metadata(fileobj):
     -------
     dict
         Metadata dictionary for plugin.
+
+    Raises
+    ------
+    IOError
+        If archive does not contain a ``properties.yml`` file.
     '''
-    tar = tarfile.open(mode="r:gz", fileobj=fileobj)
+    try:
+        # Read `properties.yml` member directly from archive (stop
+        # decompressing as soon as it is found).
+        with _open_tar(fileobj) as tar:
+            for member in tar:
+                if os.path.normpath(member.name) == 'properties.yml' and \
+                        member.isfile():
+                    return safe_load(tar.extractfile(member).read())
+        raise IOError('`properties.yml` not found in plugin archive.')
+    finally:
+        fileobj.seek(0)
+
 
-    plugin_path = path(tmp.mkdtemp(prefix='mpm-'))
+def _sha256(fileobj):
+    '''
+    Parameters
+    ----------
+    fileobj : file-like
+        Seekable binary file object.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest of file contents.  File object is positioned at the
+        start on return.
+    '''
+    sha256 = hashlib.sha256()
+    fileobj.seek(0)
+    for chunk_i in iter(lambda: fileobj.read(ARCHIVE_BUFSIZE), b''):
+        sha256.update(chunk_i)
+    fileobj.seek(0)
+    return sha256.hexdigest()
+
+
+def _installed_digest(plugin_path):
+    '''
+    Parameters
+    ----------
+    plugin_path : str
+        Plugin directory path.
+
+    Returns
+    -------
+    str or None
+        SHA-256 digest of archive installed plugin was extracted from, or
+        ``None`` if not available.
+    '''
     try:
-        tar.extractall(path=str(plugin_path))
+        with open(os.path.join(plugin_path, DIGEST_FILENAME), 'r') as input_:
+            return input_.read().strip()
+    except OSError:
+        return None
 
-        properties_path = plugin_path.joinpath('properties.yml')
-        return yaml.safe_load(properties_path.read_text())
 
-    finally:
-        fileobj.seek(0)
-        plugin_path.rmtree()
+class _ProgressReader(io.RawIOBase):
+    '''
+    Read-only file-like wrapper which updates a progress bar with the number
+    of bytes read (and, optionally, a hash of the data read).
+    '''
+    def __init__(self, fileobj, bar, hash_=None):
+        super().__init__()
+        self._fileobj = fileobj
+        self._bar = bar
+        self._hash = hash_
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self._bar.update(len(data))
+        if self._hash is not None:
+            self._hash.update(data)
+        return data
+
+    def readinto(self, buffer_):
+        # Used by buffered readers, e.g., `gzip_ng`.
+        data = self.read(len(buffer_))
+        buffer_[:len(data)] = data
+        return len(data)
+
+
+def _install_stream(stream, plugin_path, total_bytes=None, hash_=None,
+                    position=None, desc=None):
+    '''
+    Extract and install plugin from (non-seekable) stream, e.g., HTTP response
+    body, displaying download progress.
 
+    Parameters
+    ----------
+    stream : file-like
+        MicroDrop plugin archive stream.
+    plugin_path : path
+        Target plugin install directory path.
+    total_bytes : int, optional
+        Size of archive in bytes (if known).
+    hash_ : hashlib hash object, optional
+        If specified, updated with archive data as it is read.
+    position : int, optional
+        Line offset of progress bar.
+    desc : str, optional
+        Progress bar label (e.g., plugin name).
 
-def install_fileobj(fileobj, plugin_path):
+    Returns
+    -------
+    (path, dict)
+        Directory of installed plugin and metadata dictionary for plugin.
+    '''
+    with tqdm(total=total_bytes, unit='B', unit_scale=True,
+              position=position, desc=desc) as bar:
+        reader = _ProgressReader(stream, bar, hash_)
+        result = install_fileobj(reader, plugin_path,
+                                 bufsize=DOWNLOAD_CHUNK_SIZE)
+        if hash_ is not None:
+            # Read any trailing data (e.g., tar padding) not consumed during
+            # extraction, so digest covers the complete archive.
+            for _ in iter(lambda: reader.read(DOWNLOAD_CHUNK_SIZE), b''):
+                pass
+        return result
+
+
+def _safe_members(members):
+    '''
+    Parameters
+    ----------
+    members : iterable
+        Tar archive members (e.g., :class:`tarfile.TarFile` opened in streaming
+        mode).
+
+    Yields
+    ------
+    tarfile.TarInfo
+        Members with relative paths inside the archive root, as they are read.
+    '''
+    for member in members:
+        name = member.name.replace('\\', '/')
+        if name.startswith('/') or os.path.isabs(name) or \
+                '..' in name.split('/'):
+            logger.warning('Skipping unsafe archive member: `%s`', member.name)
+            continue
+        yield member
+
+
+def install_fileobj(fileobj, plugin_path, bufsize=ARCHIVE_BUFSIZE):
     """
     Extract and install plugin from file-like object (e.g., opened file,
     ``StringIO``).
 
+    Archive is read in streaming mode (i.e., sequentially), so
+    :data:`fileobj` does not need to be seekable.
+
     Parameters
     ----------
     fileobj : file-like
         MicroDrop plugin file object to extract and install.
     plugin_path : path
         Target plugin install directory path.
+    bufsize : int, optional
+        Size of blocks read from :data:`fileobj`.
 
     Returns
     -------
@@ -302,16 +825,21 @@ def install_fileobj(fileobj, plugin_path):
         Directory of installed plugin and metadata dictionary for plugin.
     """
     plugin_path = path(plugin_path)
-    tar = tarfile.open(mode="r:gz", fileobj=fileobj)
 
     try:
-        tar.extractall(path=str(plugin_path))
-
-        plugin_metadata = yaml.safe_load(plugin_path.joinpath('properties.yml').read_text())
-        fileobj.seek(0)
+        with _open_tar(fileobj, bufsize=bufsize) as tar:
+            tar.extractall(path=os.fspath(plugin_path), members=_safe_members(tar),
+                           **({'filter': 'data'}
+                              if hasattr(tarfile, 'data_filter') else {}))
+
+        # Read metadata of just extracted files directly (i.e., not cached).
+        with open(os.path.join(plugin_path, 'properties.yml'), 'rb') as input_:
+            plugin_metadata = safe_load(input_.read())
+        if getattr(fileobj, 'seekable', lambda: False)():
+            fileobj.seek(0)
     except:
-        # Error occured, so delete extracted plugin.
-        plugin_path.rmtree()
+        # Error occured, so delete extracted plugin (if any).
+        _rmtree(plugin_path, ignore_missing=True)
         raise
 
     # TODO Handle `requirements.txt`.
@@ -334,7 +862,7 @@ def uninstall(plugin_package, plugins_directory):
                       (plugin_package, plugins_directory))
     else:
         try:
-            plugin_metadata = yaml.safe_load(plugin_path.joinpath('properties.yml').read_text())
+            plugin_metadata = load_properties(os.path.join(plugin_path, 'properties.yml'))
             existing_version = plugin_metadata['version']
         except:
             existing_version = None
@@ -347,7 +875,7 @@ def uninstall(plugin_package, plugins_directory):
 
     # Uninstall latest release
     # ======================
-    plugin_path.rmtree()
+    _rmtree(plugin_path)
     print('  \--> done')
 
 
@@ -365,11 +893,16 @@ def freeze(plugins_directory):
     '''
     # Check existing version (if any).
     package_versions = []
-    for plugin_path_i in path(plugins_directory).dirs():
-        if plugin_path_i.isdir():
+    # Use `os.scandir` so directory checks use the cached entry type, rather
+    # than a `stat` per entry.
+    with os.scandir(plugins_directory) as entries:
+        for entry_i in entries:
+            if not entry_i.is_dir():
+                continue
             try:
-                plugin_metadata = yaml.safe_load(plugin_path_i.joinpath('properties.yml').read_text())
-                if plugin_path_i.name != plugin_metadata['package_name']:
+                plugin_metadata = load_properties(os.path.join(entry_i.path,
+                                                               'properties.yml'))
+                if entry_i.name != plugin_metadata['package_name']:
                     continue
                 package_versions.append((plugin_metadata['package_name'], plugin_metadata['version']))
             except:
@@ -396,6 +929,12 @@ def search(plugin_package, server_url=DEFAULT_SERVER_URL):
         Name of found plugin and mapping of version strings to plugin package
         metadata dictionaries.
 
+    Notes
+    -----
+    Unlike :func:`install`, no HTTP session may be specified, since the index
+    is queried by ``pip_helpers.get_releases``, which performs its own
+    requests (results are cached, see :func:`_get_releases`).
+
 
     .. _version specifiers:
         https://www.python.org/dev/peps/pep-0440/#version-specifiers
@@ -407,4 +946,4 @@ def search(plugin_package, server_url=DEFAULT_SERVER_URL):
     '''
 
     # Look up latest release matching specifiers.
-    return get_releases(plugin_package, server_url=server_url)
+    return _get_releases(plugin_package, server_url=server_url)
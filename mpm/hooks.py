@@ -1,5 +1,4 @@
 import logging
-import os
 import subprocess as sp
 import sys
 
@@ -23,8 +22,6 @@ def on_plugin_install(plugin_directory, ostream=sys.stdout):
     ostream :file-like
         Output stream for status messages (default: ``sys.stdout``).
     """
-    current_directory = os.getcwd()
-
     plugin_directory = ph.path(plugin_directory).realpath()
     print(f'Processing post-install hook for: {plugin_directory.name}', file=ostream)
 
@@ -34,17 +31,22 @@ def on_plugin_install(plugin_directory, ostream=sys.stdout):
     if hook_path_i.isfile():
         logger.info('Processing post-install hook for: %s',
                     plugin_directory.name)
-        os.chdir(hook_path_i.parent)
         try:
-            process = sp.Popen([hook_path_i, sys.executable], shell=True,
-                               stdin=sp.PIPE)
-            # Emulate return key press in case plugin uses
-            # "Press <enter> key to continue..." prompt.
-            process.communicate(input='\r\n'.encode())
-            if process.returncode != 0:
+            # Run hook in its own directory (without changing the working
+            # directory of this process, so hooks may run concurrently).
+            #
+            # Batch files are run directly (i.e., without an intermediate
+            # shell).  Standard input is empty, so any
+            # "Press <enter> key to continue..." prompt returns immediately.
+            process = sp.Popen([str(hook_path_i), sys.executable],
+                               cwd=str(hook_path_i.parent), stdin=sp.DEVNULL,
+                               stdout=sp.PIPE, stderr=sp.STDOUT)
+            with process.stdout:
+                # Write hook output to output stream as it is produced.
+                for line_i in process.stdout:
+                    ostream.write(line_i.decode(errors='replace'))
+            if process.wait() != 0:
                 raise RuntimeError(f'Process return code == {process.returncode}')
             return hook_path_i
         except Exception as exception:
             raise RuntimeError(f'Error running: {hook_path_i}\n{exception}')
-        finally:
-            os.chdir(current_directory)
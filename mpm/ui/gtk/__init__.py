@@ -1,9 +1,5 @@
 import logging
 import threading
-import gi
-
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib, GObject
 
 import conda_helpers as ch
 import logging_helpers as lh
@@ -13,18 +9,20 @@ from ...api import installed_plugins, update
 logger = logging.getLogger(__name__)
 
 
-# In GTK3, GDK threads should be initialized like this, if needed. However,
-# this is often not necessary in modern GTK3 applications unless you're directly
-# using GDK in threads. GTK3 itself is thread-aware.
-GObject.threads_init()  # Deprecated and usually not needed in GTK3
-
 def update_plugin_dialog(package_name=None, update_args=None,
                          update_kwargs=None, ignore_not_installed=True):
     '''
     Launch dialog to track status of update of specified plugin package.
 
     Adjusted for Python 3.8 and GTK3.
+
+    GTK is imported on first call, so importing this module does not load
+    PyGObject.
     '''
+    import gi
+
+    gi.require_version('Gtk', '3.0')
+    from gi.repository import Gtk, GLib
 
     thread_context = {}
 
@@ -51,7 +49,7 @@ def update_plugin_dialog(package_name=None, update_args=None,
     package_name_list = ', '.join('`{}`'.format(name_i) for name_i in package_name)
     package_name_lines = '\n'.join(' - {}'.format(name_i) for name_i in package_name)
 
-    def _update(update_complete, package_name):
+    def _update(package_name):
         try:
             with lh.logging_restore(clear_handlers=True):
                 args = update_args or []
@@ -87,18 +85,19 @@ def update_plugin_dialog(package_name=None, update_args=None,
                                      .format(package_name_lines))
             GLib.idle_add(_error)
             thread_context['update_response'] = None
-        update_complete.set()
-
-    def _pulse(update_complete, progress_bar):
-        while not update_complete.wait(1. / 16):
-            GLib.idle_add(progress_bar.pulse)
 
         def _on_complete():
+            GLib.source_remove(pulse_id)
             progress_bar.set_fraction(1.0)
             progress_bar.hide()
 
         GLib.idle_add(_on_complete)
 
+    def _pulse():
+        progress_bar.pulse()
+        # Keep timer running until removed.
+        return True
+
     dialog = Gtk.MessageDialog(buttons=Gtk.ButtonsType.OK_CANCEL)
     dialog.set_position(Gtk.WindowPosition.MOUSE)
     dialog.props.resizable = True
@@ -111,13 +110,10 @@ def update_plugin_dialog(package_name=None, update_args=None,
     dialog.props.title = 'Update plugin'
     dialog.props.text = 'Searching for updates...'
 
-    update_complete = threading.Event()
-
-    progress_thread = threading.Thread(target=_pulse, args=(update_complete, progress_bar,))
-    progress_thread.daemon = True
-    progress_thread.start()
+    # Pulse progress bar from main loop timer until update is complete.
+    pulse_id = GLib.timeout_add(1000 // 16, _pulse)
 
-    update_thread = threading.Thread(target=_update, args=(update_complete, package_name,))
+    update_thread = threading.Thread(target=_update, args=(package_name,))
     update_thread.daemon = True
     update_thread.start()
 
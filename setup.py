@@ -5,7 +5,7 @@ import setuptools as st
 sys.path.insert(0, '.')
 
 install_requires = ['microdrop-libs',
-                    'progressbar2', 'pyyaml', 'si-prefix>=0.4.post3']
+                    'pyyaml', 'si-prefix>=0.4.post3', 'tqdm']
 
 if platform.system() == 'Windows':
     install_requires += ['pywin32']